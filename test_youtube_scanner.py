@@ -5,11 +5,42 @@ Unit tests for YouTube Channel Scanner
 import unittest
 from unittest.mock import patch, MagicMock, mock_open, call
 import subprocess
+import io
 import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
 from datetime import datetime
 import youtube_scanner
 
 
+def setUpModule():
+    """Keep the on-disk details cache out of the user's home directory."""
+    global _cache_dir, _original_cache_path
+    _cache_dir = tempfile.mkdtemp()
+    _original_cache_path = youtube_scanner.DETAILS_CACHE_PATH
+    youtube_scanner.DETAILS_CACHE_PATH = os.path.join(_cache_dir, 'details.db')
+
+
+def tearDownModule():
+    reset_details_cache()
+    youtube_scanner.DETAILS_CACHE_PATH = _original_cache_path
+    shutil.rmtree(_cache_dir, ignore_errors=True)
+
+
+def reset_details_cache():
+    """Close and delete the details cache between tests."""
+    if youtube_scanner._details_cache is not None:
+        youtube_scanner._details_cache.close()
+        youtube_scanner._details_cache = None
+    youtube_scanner._details_cache_failed = False
+    if os.path.exists(youtube_scanner.DETAILS_CACHE_PATH):
+        os.remove(youtube_scanner.DETAILS_CACHE_PATH)
+
+
 class TestRunYtdlp(unittest.TestCase):
     """Tests for run_ytdlp function."""
 
@@ -21,7 +52,7 @@ class TestRunYtdlp(unittest.TestCase):
 
         self.assertEqual(result, "output data")
         mock_run.assert_called_once_with(
-            ["yt-dlp", "--version"],
+            ["yt-dlp", *youtube_scanner.YTDLP_COMMON_ARGS, "--version"],
             capture_output=True,
             text=True,
             timeout=300
@@ -45,6 +76,92 @@ class TestRunYtdlp(unittest.TestCase):
         mock_exit.assert_called_once_with(1)
 
 
+class TestRunYtdlpBatch(unittest.TestCase):
+    """Tests for run_ytdlp_batch function."""
+
+    @patch('subprocess.run')
+    def test_run_ytdlp_batch_single_process(self, mock_run):
+        """Test all URLs are passed to a single yt-dlp invocation."""
+        mock_run.return_value = MagicMock(stdout="output data")
+        result = youtube_scanner.run_ytdlp_batch(["--skip-download"], ["url1", "url2"])
+
+        self.assertEqual(result, "output data")
+        mock_run.assert_called_once_with(
+            ["yt-dlp", *youtube_scanner.YTDLP_COMMON_ARGS, "--skip-download", "--batch-file", "-"],
+            input="url1\nurl2\n",
+            capture_output=True,
+            text=True,
+            timeout=300
+        )
+
+    @patch('subprocess.run')
+    def test_run_ytdlp_batch_timeout(self, mock_run):
+        """Test batch timeout handling."""
+        mock_run.side_effect = subprocess.TimeoutExpired("yt-dlp", 300)
+        result = youtube_scanner.run_ytdlp_batch([], ["url1"])
+
+        self.assertEqual(result, "")
+
+    @patch('subprocess.run')
+    def test_run_ytdlp_batch_timeout_keeps_partial_output(self, mock_run):
+        """Test complete lines printed before a timeout are kept."""
+        mock_run.side_effect = subprocess.TimeoutExpired("yt-dlp", 300, output=b"vid1\tunlisted\t20231225\nvid2\tunl")
+        result = youtube_scanner.run_ytdlp_batch([], ["url1", "url2"])
+
+        self.assertEqual(result, "vid1\tunlisted\t20231225\n")
+
+    @patch('subprocess.run')
+    @patch('sys.exit')
+    def test_run_ytdlp_batch_not_found(self, mock_exit, mock_run):
+        """Test yt-dlp not installed."""
+        mock_run.side_effect = FileNotFoundError()
+        youtube_scanner.run_ytdlp_batch([], ["url1"])
+
+        mock_exit.assert_called_once_with(1)
+
+
+class TestRunYtdlpStream(unittest.TestCase):
+    """Tests for run_ytdlp_stream function."""
+
+    @patch('subprocess.Popen')
+    def test_run_ytdlp_stream_yields_lines(self, mock_popen):
+        """Test output lines are yielded without trailing newlines."""
+        proc = mock_popen.return_value
+        proc.stdout = io.StringIO("line 1\nline 2\n")
+        proc.poll.return_value = 0
+
+        result = list(youtube_scanner.run_ytdlp_stream(["--version"]))
+
+        self.assertEqual(result, ["line 1", "line 2"])
+        self.assertEqual(mock_popen.call_args[0][0],
+                         ["yt-dlp", *youtube_scanner.YTDLP_COMMON_ARGS, "--version"])
+        proc.kill.assert_not_called()
+        proc.wait.assert_called_once()
+
+    @patch('subprocess.Popen')
+    def test_run_ytdlp_stream_closed_early(self, mock_popen):
+        """Test yt-dlp is killed when the consumer stops early."""
+        proc = mock_popen.return_value
+        proc.stdout = io.StringIO("line 1\nline 2\n")
+        proc.poll.return_value = None
+
+        stream = youtube_scanner.run_ytdlp_stream(["--version"])
+        self.assertEqual(next(stream), "line 1")
+        stream.close()
+
+        proc.kill.assert_called_once()
+
+    @patch('subprocess.Popen')
+    @patch('sys.exit')
+    def test_run_ytdlp_stream_not_found(self, mock_exit, mock_popen):
+        """Test yt-dlp not installed."""
+        mock_popen.side_effect = FileNotFoundError()
+        result = list(youtube_scanner.run_ytdlp_stream(["--version"]))
+
+        self.assertEqual(result, [])
+        mock_exit.assert_called_once_with(1)
+
+
 class TestFormatDate(unittest.TestCase):
     """Tests for format_date function."""
 
@@ -53,6 +170,11 @@ class TestFormatDate(unittest.TestCase):
         result = youtube_scanner.format_date("20231225", "NA")
         self.assertEqual(result, "2023-12-25")
 
+    def test_format_date_iso(self):
+        """Test an already formatted date is returned unchanged."""
+        result = youtube_scanner.format_date("2023-12-25", "1703548800")
+        self.assertEqual(result, "2023-12-25")
+
     def test_format_date_with_timestamp(self):
         """Test formatting with timestamp fallback."""
         result = youtube_scanner.format_date("NA", "1703548800")
@@ -79,6 +201,25 @@ class TestFormatDate(unittest.TestCase):
         result = youtube_scanner.format_date("", "")
         self.assertEqual(result, "NA")
 
+    def test_format_date_yyyymmdd_ignores_timestamp(self):
+        """Test a valid YYYYMMDD date wins over the timestamp."""
+        result = youtube_scanner.format_date("20231225", "1")
+        self.assertEqual(result, "2023-12-25")
+
+    def test_format_date_int_yyyymmdd(self):
+        """Test formatting YYYYMMDD given as an integer."""
+        result = youtube_scanner.format_date(20231225)
+        self.assertEqual(result, "2023-12-25")
+
+    def test_format_date_memoized(self):
+        """Test repeated dates are served from the cache."""
+        youtube_scanner.format_date.cache_clear()
+        youtube_scanner.format_date("20231225", "NA")
+        result = youtube_scanner.format_date("20231225", "NA")
+
+        self.assertEqual(result, "2023-12-25")
+        self.assertEqual(youtube_scanner.format_date.cache_info().hits, 1)
+
     def test_format_date_malformed_8_digit_string(self):
         """Test 8-character string gets formatted."""
         # Any 8-character string gets formatted with dashes
@@ -106,6 +247,97 @@ class TestFormatVideoLine(unittest.TestCase):
         result = youtube_scanner.format_video_line(video)
         self.assertEqual(result, "[N/A]  - \n")
 
+    def test_format_video_line_url_from_id(self):
+        """Test the URL is built from the ID when the record has none."""
+        video = {'id': 'abc123', 'upload_date': '2023-12-25', 'title': 'Test Video'}
+        result = youtube_scanner.format_video_line(video)
+        expected = "[2023-12-25] https://www.youtube.com/watch?v=abc123 - Test Video\n"
+        self.assertEqual(result, expected)
+
+    def test_format_video_line_non_string_fields(self):
+        """Test non-string values are rendered like str()."""
+        video = {'upload_date': None, 'url': 'u', 'title': 42}
+        result = youtube_scanner.format_video_line(video)
+        self.assertEqual(result, "[None] u - 42\n")
+
+
+class TestChannelSubpath(unittest.TestCase):
+    """Tests for channel_subpath function."""
+
+    def test_channel_subpath(self):
+        """Test tab URLs strip trailing slashes and keep query strings."""
+        self.assertEqual(youtube_scanner.channel_subpath("https://www.youtube.com/@testuser/", "videos"),
+                         "https://www.youtube.com/@testuser/videos")
+        self.assertEqual(youtube_scanner.channel_subpath("https://www.youtube.com/@testuser?foo=bar", "playlists"),
+                         "https://www.youtube.com/@testuser/playlists?foo=bar")
+
+
+class TestVideo(unittest.TestCase):
+    """Tests for the Video record class."""
+
+    def test_video_item_access(self):
+        """Test dict-style reads and writes map to slots."""
+        video = youtube_scanner.Video('vid1', 'Title', 'unlisted', '2023-12-25')
+        video['found_in_playlist'] = 'Playlist 1'
+
+        self.assertEqual(video['id'], 'vid1')
+        self.assertEqual(video.found_in_playlist, 'Playlist 1')
+        self.assertIn('found_in_playlist', video)
+        self.assertNotIn('reason', video)
+        self.assertEqual(video.get('reason', 'none'), 'none')
+        self.assertEqual(video.get('to_dict'), None)
+
+    def test_video_unknown_keys(self):
+        """Test unset and unknown keys raise KeyError."""
+        video = youtube_scanner.Video('vid1', 'Title', 'unlisted', '2023-12-25')
+
+        with self.assertRaises(KeyError):
+            video['reason']
+        with self.assertRaises(KeyError):
+            video['url'] = 'https://example.com'
+        self.assertFalse(hasattr(video, '__dict__'))
+
+    def test_video_update_and_to_dict(self):
+        """Test update() and to_dict() round-trip set fields and the derived URL."""
+        video = youtube_scanner.Video('vid1', 'Title', 'unknown', 'NA')
+        video.update({'availability': 'private', 'upload_date': '2023-12-26'})
+
+        self.assertEqual(video.to_dict(), {
+            'id': 'vid1', 'title': 'Title', 'url': 'https://www.youtube.com/watch?v=vid1',
+            'availability': 'private', 'upload_date': '2023-12-26'
+        })
+        self.assertEqual(dict(video), video.to_dict())
+
+    def test_video_mapping_protocol(self):
+        """Test Video supports the full mapping protocol and compares like a dict."""
+        video = youtube_scanner.Video('vid1', 'Title', 'unlisted', '2023-12-25')
+        video['reason'] = 'Test'
+
+        self.assertEqual(list(video), ['id', 'title', 'url', 'availability', 'upload_date', 'reason'])
+        self.assertEqual(len(video), 6)
+        self.assertEqual(dict(video.items())['url'], 'https://www.youtube.com/watch?v=vid1')
+        self.assertEqual(video, dict(video))
+        self.assertEqual(list(video.to_dict().items()), list(video.items()))
+        self.assertEqual(youtube_scanner.Video('vid1', 'Title', 'unlisted', '2023-12-25'),
+                         youtube_scanner.Video('vid1', 'Title', 'unlisted', '2023-12-25'))
+
+        del video['reason']
+        self.assertNotIn('reason', video)
+        with self.assertRaises(KeyError):
+            del video['reason']
+        with self.assertRaises(KeyError):
+            video['url'] = 'https://example.com'
+
+    def test_video_format_and_save(self):
+        """Test Video records render in the links file and serialize to JSON."""
+        video = youtube_scanner.Video('vid1', 'Title', 'unlisted', '2023-12-25')
+
+        line = youtube_scanner.format_video_line(video)
+        saved = json.dumps([video], default=youtube_scanner._video_with_url)
+
+        self.assertEqual(line, "[2023-12-25] https://www.youtube.com/watch?v=vid1 - Title\n")
+        self.assertEqual(json.loads(saved)[0]['url'], 'https://www.youtube.com/watch?v=vid1')
+
 
 class TestParseVideoEntry(unittest.TestCase):
     """Tests for parse_video_entry function."""
@@ -152,13 +384,64 @@ class TestParseVideoEntry(unittest.TestCase):
         self.assertEqual(result['upload_date'], '2023-12-25')
 
 
+    def test_parse_video_entry_interns_repeated_values(self):
+        """Test repeated availability and date values share one string."""
+        first = youtube_scanner.parse_video_entry(['id1', 'A', ''.join(['un', 'listed']), '20231225'])
+        second = youtube_scanner.parse_video_entry(['id2', 'B', ''.join(['unl', 'isted']), '20231225'])
+
+        self.assertIs(first['availability'], second['availability'])
+        self.assertIs(first['upload_date'], second['upload_date'])
+
+
+class TestParseVideoEntryJson(unittest.TestCase):
+    """Tests for parse_video_entry_json function."""
+
+    def test_parse_video_entry_json_with_availability(self):
+        """Test parsing a JSON record with availability."""
+        entry = {'id': 'abc123', 'title': 'Test Video', 'availability': 'unlisted',
+                 'upload_date': '20231225', 'timestamp': 1703548800}
+        result = youtube_scanner.parse_video_entry_json(entry)
+
+        self.assertEqual(result['id'], 'abc123')
+        self.assertEqual(result['title'], 'Test Video')
+        self.assertEqual(result['url'], 'https://www.youtube.com/watch?v=abc123')
+        self.assertEqual(result['availability'], 'unlisted')
+        self.assertEqual(result['upload_date'], '2023-12-25')
+
+    def test_parse_video_entry_json_without_availability(self):
+        """Test channel videos are marked public."""
+        entry = {'id': 'xyz789', 'title': 'Another Video', 'availability': None}
+        result = youtube_scanner.parse_video_entry_json(entry, include_availability=False)
+
+        self.assertEqual(result['availability'], 'public')
+        self.assertEqual(result['upload_date'], 'NA')
+
+    def test_parse_video_entry_json_nulls(self):
+        """Test null fields fall back to defaults."""
+        entry = {'id': 'id123', 'title': None, 'availability': None,
+                 'upload_date': None, 'timestamp': None}
+        result = youtube_scanner.parse_video_entry_json(entry)
+
+        self.assertEqual(result['title'], '')
+        self.assertEqual(result['availability'], 'unknown')
+        self.assertEqual(result['upload_date'], 'NA')
+
+    def test_parse_video_entry_json_release_date_fallback(self):
+        """Test release date is used when upload date is missing."""
+        entry = {'id': 'vid123', 'title': 'Premiere', 'release_timestamp': 1703548800}
+        result = youtube_scanner.parse_video_entry_json(entry)
+
+        expected = datetime.fromtimestamp(1703548800).strftime("%Y-%m-%d")
+        self.assertEqual(result['upload_date'], expected)
+
+
 class TestGetChannelPlaylists(unittest.TestCase):
     """Tests for get_channel_playlists function."""
 
     @patch('youtube_scanner.run_ytdlp')
     def test_get_channel_playlists_success(self, mock_run_ytdlp):
         """Test getting channel playlists."""
-        mock_run_ytdlp.return_value = "PLabc123|||Playlist 1\nPLxyz789|||Playlist 2\n"
+        mock_run_ytdlp.return_value = "PLabc123\tPlaylist 1\nPLxyz789\tPlaylist 2\n"
 
         result = youtube_scanner.get_channel_playlists("https://www.youtube.com/@testuser")
 
@@ -190,26 +473,54 @@ class TestGetChannelPlaylists(unittest.TestCase):
 class TestGetPlaylistVideos(unittest.TestCase):
     """Tests for get_playlist_videos function."""
 
-    @patch('youtube_scanner.run_ytdlp')
-    def test_get_playlist_videos_success(self, mock_run_ytdlp):
+    @patch('youtube_scanner.run_ytdlp_stream')
+    def test_get_playlist_videos_success(self, mock_run_stream):
         """Test getting videos from playlist."""
-        mock_run_ytdlp.return_value = (
-            "vid1|||Video 1|||public|||20231225|||1703548800\n"
-            "vid2|||Video 2|||unlisted|||20231226|||1703635200\n"
-        )
+        mock_run_stream.return_value = iter([
+            '{"id": "vid1", "title": "Video 1", "availability": "public", "upload_date": "20231225"}',
+            '{"id": "vid2", "title": "Video 2", "availability": "unlisted", "upload_date": "20231226"}'
+        ])
 
         result = youtube_scanner.get_playlist_videos("https://www.youtube.com/playlist?list=PLabc123")
 
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]['id'], 'vid1')
         self.assertEqual(result[0]['availability'], 'public')
+        self.assertEqual(result[0]['upload_date'], '2023-12-25')
         self.assertEqual(result[1]['id'], 'vid2')
         self.assertEqual(result[1]['availability'], 'unlisted')
 
-    @patch('youtube_scanner.run_ytdlp')
-    def test_get_playlist_videos_empty(self, mock_run_ytdlp):
+    @patch('youtube_scanner.run_ytdlp_stream')
+    def test_get_playlist_videos_skips_non_json(self, mock_run_stream):
+        """Test stray or malformed lines are ignored."""
+        mock_run_stream.return_value = iter([
+            'WARNING: something',
+            '{"id": "vid1", "title": "Video 1"',
+            '{"id": "vid2", "title": "Title with\\ttab | and ||| pipes"}'
+        ])
+
+        result = youtube_scanner.get_playlist_videos("https://www.youtube.com/playlist?list=PLabc123")
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]['id'], 'vid2')
+        self.assertEqual(result[0]['title'], 'Title with\ttab | and ||| pipes')
+        self.assertEqual(result[0]['availability'], 'unknown')
+
+    @patch('youtube_scanner.run_ytdlp_stream')
+    def test_get_playlist_videos_uses_flat_listing(self, mock_run_stream):
+        """Test playlist listing skips per-video extraction."""
+        mock_run_stream.return_value = iter([])
+
+        youtube_scanner.get_playlist_videos("https://www.youtube.com/playlist?list=PLabc123")
+
+        args = mock_run_stream.call_args[0][0]
+        self.assertIn('--flat-playlist', args)
+        self.assertIn('youtubetab:approximate_date', args)
+
+    @patch('youtube_scanner.run_ytdlp_stream')
+    def test_get_playlist_videos_empty(self, mock_run_stream):
         """Test empty playlist."""
-        mock_run_ytdlp.return_value = ""
+        mock_run_stream.return_value = iter([])
 
         result = youtube_scanner.get_playlist_videos("https://www.youtube.com/playlist?list=PLempty")
 
@@ -219,43 +530,130 @@ class TestGetPlaylistVideos(unittest.TestCase):
 class TestGetChannelVideos(unittest.TestCase):
     """Tests for get_channel_videos function."""
 
-    @patch('youtube_scanner.run_ytdlp')
-    def test_get_channel_videos_success(self, mock_run_ytdlp):
+    @patch('youtube_scanner.run_ytdlp_stream')
+    def test_get_channel_videos_success(self, mock_run_stream):
         """Test getting channel videos."""
-        mock_run_ytdlp.return_value = (
-            "vid1|||Video 1|||20231225|||1703548800\n"
-            "vid2|||Video 2|||20231226|||1703635200\n"
-        )
+        mock_run_stream.return_value = iter([
+            '{"id": "vid1", "title": "Video 1", "upload_date": "20231225", "timestamp": null}',
+            '{"id": "vid2", "title": "Video 2", "upload_date": "20231226", "timestamp": null}'
+        ])
 
         result = youtube_scanner.get_channel_videos("https://www.youtube.com/@testuser")
 
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]['id'], 'vid1')
         self.assertEqual(result[0]['availability'], 'public')
+        self.assertEqual(result[0]['upload_date'], '2023-12-25')
+        self.assertIn('--flat-playlist', mock_run_stream.call_args[0][0])
 
 
 class TestGetVideoDetails(unittest.TestCase):
     """Tests for get_video_details function."""
 
-    @patch('youtube_scanner.run_ytdlp')
-    def test_get_video_details_success(self, mock_run_ytdlp):
+    def setUp(self):
+        reset_details_cache()
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_get_video_details_success(self, mock_run_batch):
         """Test getting video details."""
-        mock_run_ytdlp.return_value = "vid123|||Test Video|||unlisted|||20231225\n"
+        mock_run_batch.return_value = "vid123\tunlisted\t20231225\n"
 
         result = youtube_scanner.get_video_details("vid123")
 
         self.assertEqual(result['availability'], 'unlisted')
         self.assertEqual(result['upload_date'], '2023-12-25')
 
-    @patch('youtube_scanner.run_ytdlp')
-    def test_get_video_details_invalid_output(self, mock_run_ytdlp):
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_get_video_details_invalid_output(self, mock_run_batch):
         """Test handling invalid output."""
-        mock_run_ytdlp.return_value = "invalid output"
+        mock_run_batch.return_value = "invalid output"
 
         result = youtube_scanner.get_video_details("vid123")
 
         self.assertEqual(result, {})
 
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_get_video_details_cached(self, mock_run_batch):
+        """Test second call with the same ID is served from the disk cache."""
+        mock_run_batch.return_value = "vid123\tunlisted\t20231225\n"
+
+        first = youtube_scanner.get_video_details("vid123")
+        second = youtube_scanner.get_video_details("vid123")
+
+        self.assertEqual(first, second)
+        mock_run_batch.assert_called_once()
+        self.assertEqual(mock_run_batch.call_args[0][1], ['https://www.youtube.com/watch?v=vid123'])
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_get_video_details_cache_expired(self, mock_run_batch):
+        """Test expired cache entries are fetched again."""
+        mock_run_batch.return_value = "vid123\tunlisted\t20231225\n"
+
+        youtube_scanner.get_video_details("vid123")
+        with patch('time.time', return_value=time.time() + youtube_scanner.DETAILS_CACHE_TTL + 1):
+            youtube_scanner.get_video_details("vid123")
+
+        self.assertEqual(mock_run_batch.call_count, 2)
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_get_video_details_unresolved_not_cached(self, mock_run_batch):
+        """Test unresolved details are returned but fetched again on the next call."""
+        mock_run_batch.return_value = "vid123\tNA\tNA\n"
+
+        first = youtube_scanner.get_video_details("vid123")
+        youtube_scanner.get_video_details("vid123")
+
+        self.assertEqual(first, {'availability': 'NA', 'upload_date': 'NA'})
+        self.assertEqual(mock_run_batch.call_count, 2)
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    @patch('sqlite3.connect')
+    def test_get_video_details_cache_unavailable(self, mock_connect, mock_run_batch):
+        """Test a cache that cannot be opened is tried once and its connection closed."""
+        mock_connect.return_value.execute.side_effect = sqlite3.OperationalError("disk I/O error")
+        mock_run_batch.return_value = "vid1\tunlisted\t20231225\nvid2\tprivate\t20231226\n"
+
+        result = youtube_scanner.get_video_details_batch(['vid1', 'vid2'])
+
+        self.assertEqual(set(result), {'vid1', 'vid2'})
+        mock_connect.assert_called_once()
+        mock_connect.return_value.close.assert_called_once()
+        reset_details_cache()
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_get_video_details_batch(self, mock_run_batch):
+        """Test several videos are fetched in one call and keyed by ID."""
+        mock_run_batch.return_value = (
+            "vid2\tprivate\t20231226\n"
+            "vid1\tunlisted\t20231225\n"
+        )
+
+        result = youtube_scanner.get_video_details_batch(['vid1', 'vid2', 'vid3'])
+
+        mock_run_batch.assert_called_once()
+        self.assertEqual(set(result), {'vid1', 'vid2'})
+        self.assertEqual(result['vid1'], {'availability': 'unlisted', 'upload_date': '2023-12-25'})
+        self.assertEqual(result['vid2']['availability'], 'private')
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_get_video_details_batch_template_skips_title(self, mock_run_batch):
+        """Test titles are left out of the detail output so tabs in them cannot shift columns."""
+        mock_run_batch.return_value = "vid1\tunlisted\t20231225\n"
+
+        result = youtube_scanner.get_video_details_batch(['vid1'])
+
+        template = mock_run_batch.call_args[0][0][-1]
+        self.assertNotIn('title', template)
+        self.assertEqual(result['vid1'], {'availability': 'unlisted', 'upload_date': '2023-12-25'})
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_get_video_details_batch_empty(self, mock_run_batch):
+        """Test no yt-dlp call is made without video IDs."""
+        result = youtube_scanner.get_video_details_batch([])
+
+        self.assertEqual(result, {})
+        mock_run_batch.assert_not_called()
+
 
 class TestScanAllPlaylists(unittest.TestCase):
     """Tests for _scan_all_playlists internal function."""
@@ -263,61 +661,134 @@ class TestScanAllPlaylists(unittest.TestCase):
     @patch('youtube_scanner.get_playlist_videos')
     def test_scan_all_playlists_success(self, mock_get_videos):
         """Test scanning multiple playlists."""
-        mock_get_videos.side_effect = [
-            [{'id': 'vid1', 'title': 'Video 1'}],
-            [{'id': 'vid2', 'title': 'Video 2'}, {'id': 'vid1', 'title': 'Video 1'}]
-        ]
+        videos_by_url = {
+            'https://youtube.com/playlist?list=PL1': [{'id': 'vid1', 'title': 'Video 1'}],
+            'https://youtube.com/playlist?list=PL2': [
+                {'id': 'vid2', 'title': 'Video 2'}, {'id': 'vid1', 'title': 'Video 1'}
+            ]
+        }
+        mock_get_videos.side_effect = lambda url: videos_by_url[url]
 
         playlists = [
             {'title': 'Playlist 1', 'url': 'https://youtube.com/playlist?list=PL1'},
             {'title': 'Playlist 2', 'url': 'https://youtube.com/playlist?list=PL2'}
         ]
 
-        result = youtube_scanner._scan_all_playlists(playlists)
+        result, _ = youtube_scanner._scan_all_playlists(playlists)
 
         self.assertEqual(len(result), 2)
         self.assertIn('vid1', result)
         self.assertIn('vid2', result)
         self.assertEqual(result['vid1']['found_in_playlist'], 'Playlist 1')
 
+    @patch('youtube_scanner.get_playlist_videos')
+    def test_scan_all_playlists_skips_duplicates(self, mock_get_videos):
+        """Test duplicate entries are neither stored nor tagged."""
+        duplicate = {'id': 'vid1', 'title': 'Video 1'}
+        videos_by_url = {
+            'url1': [{'id': 'vid1', 'title': 'Video 1'}],
+            'url2': [duplicate, {'id': '', 'title': 'No ID'}]
+        }
+        mock_get_videos.side_effect = lambda url: videos_by_url[url]
+        playlists = [
+            {'title': 'Playlist 1', 'url': 'url1'},
+            {'title': 'Playlist 2', 'url': 'url2'}
+        ]
+
+        result, _ = youtube_scanner._scan_all_playlists(playlists)
+
+        self.assertEqual(list(result), ['vid1'])
+        self.assertNotIn('found_in_playlist', duplicate)
+
     @patch('youtube_scanner.get_playlist_videos')
     def test_scan_all_playlists_empty(self, mock_get_videos):
         """Test scanning with no playlists."""
-        result = youtube_scanner._scan_all_playlists([])
+        result, unlisted = youtube_scanner._scan_all_playlists([], set())
 
         self.assertEqual(len(result), 0)
+        self.assertEqual(unlisted, [])
 
+    @patch('youtube_scanner.get_playlist_videos')
+    def test_scan_all_playlists_merge_order(self, mock_get_videos):
+        """Test first playlist wins even when a later one finishes first."""
+        first_started = threading.Event()
+
+        def fake_get_videos(url):
+            if url == 'url1':
+                # Let the second playlist finish before the first one
+                first_started.set()
+                time.sleep(0.05)
+            else:
+                first_started.wait(1)
+            return [{'id': 'shared', 'title': 'Shared'}]
+
+        mock_get_videos.side_effect = fake_get_videos
+        playlists = [
+            {'title': 'Playlist 1', 'url': 'url1'},
+            {'title': 'Playlist 2', 'url': 'url2'}
+        ]
 
-class TestIdentifyUnlistedVideos(unittest.TestCase):
-    """Tests for _identify_unlisted_videos internal function."""
+        result, _ = youtube_scanner._scan_all_playlists(playlists)
 
-    def test_identify_unlisted_videos(self):
-        """Test identifying unlisted videos."""
-        all_playlist_videos = {
-            'vid1': {'id': 'vid1', 'title': 'Public Video'},
-            'vid2': {'id': 'vid2', 'title': 'Unlisted Video'},
-            'vid3': {'id': 'vid3', 'title': 'Another Unlisted'}
-        }
-        public_ids = {'vid1'}
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result['shared']['found_in_playlist'], 'Playlist 1')
+        self.assertEqual(mock_get_videos.call_count, 2)
+
+    @patch('youtube_scanner.get_playlist_videos')
+    def test_scan_all_playlists_identifies_unlisted(self, mock_get_videos):
+        """Test videos missing from public_ids are collected while merging."""
+        mock_get_videos.return_value = [
+            {'id': 'vid1', 'title': 'Public Video'},
+            {'id': 'vid2', 'title': 'Unlisted Video'},
+            {'id': 'vid3', 'title': 'Another Unlisted'}
+        ]
+        playlists = [{'title': 'Playlist 1', 'url': 'url1'}]
+
+        result, unlisted = youtube_scanner._scan_all_playlists(playlists, {'vid1'})
 
-        result = youtube_scanner._identify_unlisted_videos(all_playlist_videos, public_ids)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(len(unlisted), 2)
+        self.assertEqual(unlisted[0]['id'], 'vid2')
+        self.assertEqual(unlisted[1]['id'], 'vid3')
+        self.assertTrue(all(v.get('reason') for v in unlisted))
+
+    @patch('youtube_scanner.get_playlist_videos')
+    def test_scan_all_playlists_all_public(self, mock_get_videos):
+        """Test no video is flagged when all are public."""
+        mock_get_videos.return_value = [
+            {'id': 'vid1', 'title': 'Video 1'},
+            {'id': 'vid2', 'title': 'Video 2'}
+        ]
+        playlists = [{'title': 'Playlist 1', 'url': 'url1'}]
+
+        result, unlisted = youtube_scanner._scan_all_playlists(playlists, {'vid1', 'vid2'})
 
         self.assertEqual(len(result), 2)
-        self.assertEqual(result[0]['id'], 'vid2')
-        self.assertEqual(result[1]['id'], 'vid3')
-        self.assertTrue(all(v.get('reason') for v in result))
+        self.assertEqual(len(unlisted), 0)
 
-    def test_identify_unlisted_videos_all_public(self):
-        """Test when all videos are public."""
-        all_playlist_videos = {
-            'vid1': {'id': 'vid1', 'title': 'Video 1'},
-            'vid2': {'id': 'vid2', 'title': 'Video 2'}
-        }
-        public_ids = {'vid1', 'vid2'}
+    @patch('youtube_scanner.get_playlist_videos')
+    def test_scan_all_playlists_without_public_ids(self, mock_get_videos):
+        """Test nothing is flagged in playlists-only mode."""
+        mock_get_videos.return_value = [{'id': 'vid1', 'title': 'Video 1'}]
+        playlists = [{'title': 'Playlist 1', 'url': 'url1'}]
 
-        result = youtube_scanner._identify_unlisted_videos(all_playlist_videos, public_ids)
+        result, unlisted = youtube_scanner._scan_all_playlists(playlists)
 
-        self.assertEqual(len(result), 0)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(unlisted, [])
+        self.assertNotIn('reason', result['vid1'])
+
+    @patch('youtube_scanner.ThreadPoolExecutor', wraps=youtube_scanner.ThreadPoolExecutor)
+    @patch('youtube_scanner.get_playlist_videos')
+    def test_scan_all_playlists_workers(self, mock_get_videos, mock_executor):
+        """Test the worker count bounds the thread pool."""
+        mock_get_videos.return_value = []
+        playlists = [{'title': f'Playlist {i}', 'url': f'url{i}'} for i in range(5)]
+
+        youtube_scanner._scan_all_playlists(playlists, workers=2)
+
+        mock_executor.assert_called_once_with(max_workers=2)
+        self.assertEqual(mock_get_videos.call_count, 5)
 
 
 class TestIdentifyUnlistedByAvailability(unittest.TestCase):
@@ -365,10 +836,16 @@ class TestIdentifyUnlistedByAvailability(unittest.TestCase):
 class TestFetchDetailedMetadata(unittest.TestCase):
     """Tests for _fetch_detailed_metadata internal function."""
 
-    @patch('youtube_scanner.get_video_details')
-    def test_fetch_detailed_metadata(self, mock_get_details):
-        """Test fetching detailed metadata."""
-        mock_get_details.return_value = {'availability': 'unlisted', 'upload_date': '2023-12-25'}
+    def setUp(self):
+        reset_details_cache()
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_fetch_detailed_metadata(self, mock_run_batch):
+        """Test fetching detailed metadata in a single batched call."""
+        mock_run_batch.return_value = (
+            "vid2\tprivate\t20231226\n"
+            "vid1\tunlisted\t20231225\n"
+        )
 
         videos = [
             {'id': 'vid1', 'title': 'Video 1'},
@@ -378,8 +855,80 @@ class TestFetchDetailedMetadata(unittest.TestCase):
         youtube_scanner._fetch_detailed_metadata(videos)
 
         self.assertEqual(videos[0]['availability'], 'unlisted')
-        self.assertEqual(videos[1]['upload_date'], '2023-12-25')
-        self.assertEqual(mock_get_details.call_count, 2)
+        self.assertEqual(videos[0]['upload_date'], '2023-12-25')
+        self.assertEqual(videos[1]['availability'], 'private')
+        self.assertEqual(videos[1]['upload_date'], '2023-12-26')
+        mock_run_batch.assert_called_once()
+        self.assertEqual(mock_run_batch.call_args[0][1], [
+            'https://www.youtube.com/watch?v=vid1',
+            'https://www.youtube.com/watch?v=vid2'
+        ])
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_fetch_detailed_metadata_concurrent_batches(self, mock_run_batch):
+        """Test large fetches are split into concurrent batches covering every video."""
+        def fake_batch(args, urls):
+            return "".join(f"{url.split('=')[1]}\tunlisted\t20231225\n" for url in urls)
+
+        mock_run_batch.side_effect = fake_batch
+        videos = [{'id': f'vid{i}', 'title': f'Video {i}'} for i in range(12)]
+
+        youtube_scanner._fetch_detailed_metadata(videos)
+
+        # 12 videos make two batches of at least MIN_BATCH_SIZE, not three of four
+        self.assertEqual(mock_run_batch.call_count, 2)
+        self.assertTrue(all(len(c[0][1]) >= youtube_scanner.MIN_BATCH_SIZE
+                            for c in mock_run_batch.call_args_list))
+        fetched = sorted(url for c in mock_run_batch.call_args_list for url in c[0][1])
+        self.assertEqual(fetched, sorted(f'https://www.youtube.com/watch?v=vid{i}' for i in range(12)))
+        self.assertTrue(all(v['availability'] == 'unlisted' for v in videos))
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_get_video_details_batch_bounded_size(self, mock_run_batch):
+        """Test large fetches queue more batches than workers, none above MAX_BATCH_SIZE."""
+        mock_run_batch.return_value = ""
+        video_ids = [f'vid{i}' for i in range(1000)]
+
+        youtube_scanner.get_video_details_batch(video_ids, workers=4)
+
+        sizes = [len(c[0][1]) for c in mock_run_batch.call_args_list]
+        self.assertEqual(sum(sizes), 1000)
+        self.assertEqual(len(sizes), 1000 // youtube_scanner.MAX_BATCH_SIZE)
+        self.assertTrue(all(size <= youtube_scanner.MAX_BATCH_SIZE for size in sizes))
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_fetch_detailed_metadata_missing_entry(self, mock_run_batch):
+        """Test videos missing from the batch output are left untouched."""
+        mock_run_batch.return_value = "vid1\tunlisted\t20231225\n"
+
+        videos = [
+            {'id': 'vid1', 'title': 'Video 1'},
+            {'id': 'vid2', 'title': 'Video 2', 'availability': 'unknown'}
+        ]
+
+        youtube_scanner._fetch_detailed_metadata(videos)
+
+        self.assertEqual(videos[0]['availability'], 'unlisted')
+        self.assertEqual(videos[1]['availability'], 'unknown')
+
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_fetch_detailed_metadata_skips_cached(self, mock_run_batch):
+        """Test cached videos are not passed to yt-dlp again."""
+        youtube_scanner._store_cached_details(
+            {'vid1': {'availability': 'unlisted', 'upload_date': '2023-12-25'}}
+        )
+        mock_run_batch.return_value = "vid2\tprivate\t20231226\n"
+
+        videos = [
+            {'id': 'vid1', 'title': 'Video 1'},
+            {'id': 'vid2', 'title': 'Video 2'}
+        ]
+
+        youtube_scanner._fetch_detailed_metadata(videos)
+
+        self.assertEqual(videos[0]['availability'], 'unlisted')
+        self.assertEqual(videos[1]['availability'], 'private')
+        self.assertEqual(mock_run_batch.call_args[0][1], ['https://www.youtube.com/watch?v=vid2'])
 
 
 class TestScanChannel(unittest.TestCase):
@@ -388,28 +937,52 @@ class TestScanChannel(unittest.TestCase):
     @patch('youtube_scanner.get_channel_videos')
     @patch('youtube_scanner.get_channel_playlists')
     @patch('youtube_scanner._scan_all_playlists')
-    @patch('youtube_scanner._identify_unlisted_videos')
-    def test_scan_channel_full(self, mock_identify, mock_scan, mock_playlists, mock_videos):
+    def test_scan_channel_full(self, mock_scan, mock_playlists, mock_videos):
         """Test full channel scan."""
         mock_videos.return_value = [{'id': 'vid1', 'title': 'Public Video'}]
         mock_playlists.return_value = [{'title': 'Playlist 1', 'url': 'url1'}]
-        mock_scan.return_value = {'vid1': {'id': 'vid1'}, 'vid2': {'id': 'vid2'}}
-        mock_identify.return_value = [{'id': 'vid2', 'title': 'Unlisted'}]
+        mock_scan.return_value = (
+            {'vid1': {'id': 'vid1'}, 'vid2': {'id': 'vid2'}},
+            [{'id': 'vid2', 'title': 'Unlisted', 'availability': 'unlisted'}]
+        )
 
         result = youtube_scanner.scan_channel("https://www.youtube.com/@test", include_public=True)
 
+        self.assertEqual(mock_scan.call_args[0][1], {'vid1'})
         self.assertIn('channel_url', result)
         self.assertIn('scan_date', result)
         self.assertEqual(len(result['public_videos']), 1)
         self.assertEqual(len(result['playlists']), 1)
         self.assertEqual(len(result['potentially_unlisted']), 1)
 
+    @patch('youtube_scanner.get_channel_videos')
+    @patch('youtube_scanner.get_channel_playlists')
+    @patch('youtube_scanner._scan_all_playlists')
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_scan_channel_full_resolves_unknown(self, mock_run_batch, mock_scan,
+                                                mock_playlists, mock_videos):
+        """Test full scan fetches availability only for candidates the listing left unknown."""
+        reset_details_cache()
+        mock_videos.return_value = []
+        mock_playlists.return_value = []
+        mock_scan.return_value = ({}, [
+            youtube_scanner.Video('vid1', 'Hidden', 'unknown', '2023-12-25'),
+            youtube_scanner.Video('vid2', 'Badged', 'unlisted', '2023-12-26')
+        ])
+        mock_run_batch.return_value = "vid1\tunlisted\t20231224\n"
+
+        result = youtube_scanner.scan_channel("https://www.youtube.com/@test", include_public=True)
+
+        self.assertEqual(mock_run_batch.call_args[0][1], ['https://www.youtube.com/watch?v=vid1'])
+        self.assertEqual([v['availability'] for v in result['potentially_unlisted']],
+                         ['unlisted', 'unlisted'])
+
     @patch('youtube_scanner.get_channel_playlists')
     @patch('youtube_scanner._scan_all_playlists')
     def test_scan_channel_playlists_only(self, mock_scan, mock_playlists):
         """Test scanning playlists only."""
         mock_playlists.return_value = []
-        mock_scan.return_value = {}
+        mock_scan.return_value = ({}, [])
 
         result = youtube_scanner.scan_channel(
             "https://www.youtube.com/@test",
@@ -419,18 +992,42 @@ class TestScanChannel(unittest.TestCase):
         self.assertEqual(len(result['public_videos']), 0)
         self.assertEqual(len(result['potentially_unlisted']), 0)
 
+    @patch('youtube_scanner.get_channel_playlists')
+    @patch('youtube_scanner._scan_all_playlists')
+    @patch('youtube_scanner.run_ytdlp_batch')
+    def test_scan_channel_playlists_only_resolves_unknown(self, mock_run_batch, mock_scan, mock_playlists):
+        """Test playlists-only mode fetches availability the flat listing left unknown."""
+        reset_details_cache()
+        mock_playlists.return_value = []
+        mock_scan.return_value = ({
+            'vid1': youtube_scanner.Video('vid1', 'Hidden', 'unknown', '2023-12-25'),
+            'vid2': youtube_scanner.Video('vid2', 'Badged', 'private', '2023-12-26'),
+            'vid3': youtube_scanner.Video('vid3', 'Shown', 'unknown', '2023-12-27')
+        }, [])
+        mock_run_batch.return_value = "vid1\tunlisted\t20231224\nvid3\tpublic\t20231227\n"
+
+        result = youtube_scanner.scan_channel(
+            "https://www.youtube.com/@test",
+            include_public=False
+        )
+
+        self.assertEqual(mock_run_batch.call_args[0][1], [
+            'https://www.youtube.com/watch?v=vid1',
+            'https://www.youtube.com/watch?v=vid3'
+        ])
+        self.assertEqual([v['id'] for v in result['potentially_unlisted']], ['vid1', 'vid2'])
+        self.assertEqual(result['potentially_unlisted'][0]['upload_date'], '2023-12-24')
+
     @patch('youtube_scanner.get_channel_videos')
     @patch('youtube_scanner.get_channel_playlists')
     @patch('youtube_scanner._scan_all_playlists')
-    @patch('youtube_scanner._identify_unlisted_videos')
     @patch('youtube_scanner._fetch_detailed_metadata')
-    def test_scan_channel_detailed(self, mock_fetch, mock_identify, mock_scan,
+    def test_scan_channel_detailed(self, mock_fetch, mock_scan,
                                    mock_playlists, mock_videos):
         """Test scan with detailed metadata."""
         mock_videos.return_value = [{'id': 'vid1'}]
         mock_playlists.return_value = []
-        mock_scan.return_value = {}
-        mock_identify.return_value = [{'id': 'vid2'}]
+        mock_scan.return_value = ({}, [{'id': 'vid2'}])
 
         youtube_scanner.scan_channel(
             "https://www.youtube.com/@test",
@@ -440,10 +1037,34 @@ class TestScanChannel(unittest.TestCase):
 
         mock_fetch.assert_called_once()
 
+    @patch('youtube_scanner.get_channel_videos')
+    @patch('youtube_scanner.get_channel_playlists')
+    @patch('youtube_scanner._scan_all_playlists')
+    @patch('youtube_scanner._fetch_detailed_metadata')
+    def test_scan_channel_detailed_refetches_listing_dates(self, mock_fetch, mock_scan,
+                                                           mock_playlists, mock_videos):
+        """Test detailed mode re-fetches videos even when the listing gave a date."""
+        mock_videos.return_value = []
+        mock_playlists.return_value = []
+        mock_scan.return_value = ({}, [
+            {'id': 'vid1', 'availability': 'unlisted', 'upload_date': '2023-12-25'},
+            {'id': 'vid2', 'availability': 'unknown', 'upload_date': 'NA'}
+        ])
+
+        youtube_scanner.scan_channel(
+            "https://www.youtube.com/@test",
+            include_public=True,
+            detailed=True
+        )
+
+        fetched = [v['id'] for v in mock_fetch.call_args[0][0]]
+        self.assertEqual(fetched, ['vid1', 'vid2'])
+
 
 class TestSaveResults(unittest.TestCase):
     """Tests for save_results function."""
 
+    @patch('youtube_scanner.orjson', None)
     @patch('builtins.open', new_callable=mock_open)
     @patch('json.dump')
     def test_save_results(self, mock_json_dump, mock_file):
@@ -456,6 +1077,83 @@ class TestSaveResults(unittest.TestCase):
         mock_file.assert_called_once_with(filename, 'w', encoding='utf-8')
         mock_json_dump.assert_called_once()
 
+    @patch('youtube_scanner.orjson', None)
+    @patch('builtins.open', new_callable=mock_open)
+    def test_save_results_adds_video_urls(self, mock_file):
+        """Test saved videos include their watch URL without touching the input."""
+        video = youtube_scanner.Video('vid1', 'Video 1', 'unlisted', '2023-12-25')
+        results = {
+            'channel_url': 'https://www.youtube.com/@test',
+            'playlists': [{'id': 'PL1', 'url': 'https://www.youtube.com/playlist?list=PL1'}],
+            'playlist_videos': [video],
+            'potentially_unlisted': [video]
+        }
+
+        youtube_scanner.save_results(results, 'test.json')
+
+        saved = json.loads(''.join(c[0][0] for c in mock_file().write.call_args_list))
+        self.assertEqual(saved['playlist_videos'][0]['url'], 'https://www.youtube.com/watch?v=vid1')
+        self.assertEqual(saved['potentially_unlisted'][0]['url'], 'https://www.youtube.com/watch?v=vid1')
+        self.assertEqual(saved['playlists'], results['playlists'])
+        self.assertFalse(hasattr(video, 'url'))
+
+    @unittest.skipIf(youtube_scanner.orjson is None, "orjson is not installed")
+    @patch('builtins.open', new_callable=mock_open)
+    def test_save_results_orjson_video_records(self, mock_file):
+        """Test orjson serializes Video records through the default hook."""
+        video = youtube_scanner.Video('vid1', 'Vidéo 1', 'unlisted', '2023-12-25')
+
+        youtube_scanner.save_results({'playlist_videos': [video]}, 'test.json')
+
+        written = mock_file().write.call_args[0][0]
+        saved = json.loads(written.decode('utf-8'))
+        self.assertEqual(saved['playlist_videos'][0]['title'], 'Vidéo 1')
+        self.assertEqual(saved['playlist_videos'][0]['url'], 'https://www.youtube.com/watch?v=vid1')
+        self.assertIn('Vidéo'.encode('utf-8'), written)
+
+    @patch('youtube_scanner.orjson')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_save_results_orjson(self, mock_file, mock_orjson):
+        """Test saving results with orjson when it is installed."""
+        mock_orjson.dumps.return_value = b'{"test": "data"}'
+        results = {'test': 'data'}
+        filename = 'test.json'
+
+        youtube_scanner.save_results(results, filename)
+
+        mock_file.assert_called_once_with(filename, 'wb')
+        mock_orjson.dumps.assert_called_once()
+        mock_file().write.assert_called_once_with(b'{"test": "data"}')
+
+
+class TestSaveResultsNdjson(unittest.TestCase):
+    """Tests for save_results_ndjson function."""
+
+    @patch('youtube_scanner.orjson', None)
+    @patch('builtins.open', new_callable=mock_open)
+    def test_save_results_ndjson(self, mock_file):
+        """Test one line is written per record, after a header line."""
+        results = {
+            'channel_url': 'https://www.youtube.com/@test',
+            'public_videos': [{'id': 'vid1'}],
+            'playlists': [],
+            'playlist_videos': [{'id': 'vid1'}, {'id': 'vid2'}],
+            'potentially_unlisted': [{'id': 'vid2'}]
+        }
+
+        youtube_scanner.save_results_ndjson(results, 'test.ndjson')
+
+        mock_file.assert_called_once_with('test.ndjson', 'w', encoding='utf-8')
+        lines = list(mock_file().writelines.call_args[0][0])
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(all(line.endswith('\n') for line in lines))
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(records[0], {'channel_url': 'https://www.youtube.com/@test'})
+        self.assertEqual(records[1], {'section': 'public_videos', 'id': 'vid1',
+                                      'url': 'https://www.youtube.com/watch?v=vid1'})
+        self.assertEqual(records[4], {'section': 'potentially_unlisted', 'id': 'vid2',
+                                      'url': 'https://www.youtube.com/watch?v=vid2'})
+
 
 class TestGetDefaultFilename(unittest.TestCase):
     """Tests for get_default_filename function."""
@@ -520,6 +1218,7 @@ class TestMain(unittest.TestCase):
         self.assertEqual(call_args[0][0], 'https://www.youtube.com/@test')
         self.assertTrue(call_args[1]['include_public'])
         self.assertFalse(call_args[1]['detailed'])
+        self.assertEqual(call_args[1]['workers'], youtube_scanner.MAX_WORKERS)
 
         # Verify results were printed and saved
         mock_print_results.assert_called_once()
@@ -593,6 +1292,32 @@ class TestMain(unittest.TestCase):
         call_args = mock_scan_channel.call_args
         self.assertTrue(call_args[1]['detailed'])
 
+    @patch('youtube_scanner.scan_channel')
+    @patch('youtube_scanner.save_results')
+    @patch('youtube_scanner.print_results')
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('sys.argv', ['youtube_scanner.py', 'https://www.youtube.com/@test',
+                        '--workers', '3'])
+    def test_main_workers(self, mock_file, mock_print_results,
+                          mock_save_results, mock_scan_channel):
+        """Test main passes the worker count through."""
+        mock_scan_channel.return_value = {
+            'potentially_unlisted': [],
+            'playlist_videos': []
+        }
+
+        youtube_scanner.main()
+
+        self.assertEqual(mock_scan_channel.call_args[1]['workers'], 3)
+
+    @patch('sys.stderr', new_callable=io.StringIO)
+    @patch('sys.argv', ['youtube_scanner.py', 'https://www.youtube.com/@test',
+                        '--workers', '0'])
+    def test_main_workers_invalid(self, mock_stderr):
+        """Test a worker count below 1 is rejected."""
+        with self.assertRaises(SystemExit):
+            youtube_scanner.main()
+
     @patch('youtube_scanner.scan_channel')
     @patch('youtube_scanner.save_results')
     @patch('youtube_scanner.print_results')
@@ -626,6 +1351,58 @@ class TestMain(unittest.TestCase):
         mock_file.assert_called()
         write_calls = list(mock_file().write.call_args_list)
         self.assertGreater(len(write_calls), 0)
+        written = ''.join(''.join(c[0][0]) for c in mock_file().writelines.call_args_list)
+        self.assertIn('[2023-12-25] https://youtube.com/watch?v=vid1 - Unlisted Video\n', written)
+        self.assertIn('[2023-12-26] https://youtube.com/watch?v=vid2 - Playlist Video\n', written)
+
+    @patch('youtube_scanner.scan_channel')
+    @patch('youtube_scanner.save_results_ndjson')
+    @patch('youtube_scanner.save_results')
+    @patch('youtube_scanner.print_results')
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('sys.argv', ['youtube_scanner.py', 'https://www.youtube.com/@test',
+                        '-o', 'scan.ndjson'])
+    def test_main_ndjson_output(self, mock_file, mock_print_results, mock_save_results,
+                                mock_save_ndjson, mock_scan_channel):
+        """Test an .ndjson output name selects the NDJSON writer."""
+        mock_scan_channel.return_value = {
+            'potentially_unlisted': [],
+            'playlist_videos': []
+        }
+
+        youtube_scanner.main()
+
+        mock_save_ndjson.assert_called_once()
+        mock_save_results.assert_not_called()
+        mock_file.assert_called_once_with('scan_links.txt', 'w', encoding='utf-8',
+                                          buffering=youtube_scanner.LINKS_BUFFER_SIZE)
+
+    @patch('youtube_scanner.scan_channel')
+    @patch('youtube_scanner.save_results')
+    @patch('youtube_scanner.print_results')
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('sys.argv', ['youtube_scanner.py', 'https://www.youtube.com/@test'])
+    def test_main_links_file_sections(self, mock_file, mock_print_results,
+                                      mock_save_results, mock_scan_channel):
+        """Test unlisted videos appear in both sections of the links file."""
+        unlisted = youtube_scanner.Video('vid1', 'Hidden', 'unlisted', '2023-12-25')
+        public = youtube_scanner.Video('vid2', 'Shown', 'public', '2023-12-26')
+        mock_scan_channel.return_value = {
+            'potentially_unlisted': [unlisted],
+            'playlist_videos': [unlisted, public]
+        }
+
+        youtube_scanner.main()
+
+        handle = mock_file()
+        written = ''.join(''.join(args[0]) for name, args, _ in handle.mock_calls
+                          if name in ('write', 'writelines'))
+        self.assertEqual(written,
+                         "# Potentially unlisted videos\n\n"
+                         "[2023-12-25] https://www.youtube.com/watch?v=vid1 - Hidden\n"
+                         "\n\n# All playlist videos\n\n"
+                         "[2023-12-25] https://www.youtube.com/watch?v=vid1 - Hidden\n"
+                         "[2023-12-26] https://www.youtube.com/watch?v=vid2 - Shown\n")
 
     @patch('youtube_scanner.get_default_filename')
     @patch('youtube_scanner.scan_channel')
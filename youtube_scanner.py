@@ -7,15 +7,79 @@ including unlisted videos that may be in public playlists.
 
 import subprocess
 import json
+import math
+import os
+import sqlite3
 import sys
+import threading
+import time
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from urllib.parse import urlsplit, urlunsplit
+from typing import Dict, Iterable, Iterator, List, Any, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing and output
+    orjson = None  # type: ignore[assignment]
 
-def run_ytdlp(args: List[str]) -> str:
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Maximum number of yt-dlp processes running at the same time
+MAX_WORKERS = 8
+
+# Smallest number of videos worth a yt-dlp process of their own
+MIN_BATCH_SIZE = 5
+
+# Largest batch for one yt-dlp process, so a batch finishes well within the timeout
+MAX_BATCH_SIZE = 50
+
+# Write buffer for the links file, large enough to batch many lines per syscall
+LINKS_BUFFER_SIZE = 1 << 16
+
+# On-disk cache of per-video details, reused across runs
+DETAILS_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "yt_channel_scanner", "details.db")
+DETAILS_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+# Placeholders yt-dlp and the parsers use when a field could not be resolved
+UNRESOLVED_VALUES = (None, '', 'unknown', 'NA')
+
+_details_cache: Optional[sqlite3.Connection] = None
+_details_cache_failed = False  # set once opening the cache has failed
+
+# Listing only needs ids, titles and dates: skip per-video extraction and
+# let the tab extractor approximate upload dates from the listing itself.
+FLAT_LISTING_ARGS = [
+    "--flat-playlist",
+    "--lazy-playlist",
+    "--extractor-args", "youtubetab:approximate_date",
+]
+
+# Passed to every yt-dlp call: no warnings or progress output to produce,
+# and give up on flaky requests quickly instead of retrying at length.
+YTDLP_COMMON_ARGS = [
+    "--no-warnings",
+    "--quiet",
+    "--no-progress",
+    "--extractor-retries", "2",
+    "--socket-timeout", "15",
+]
+
+
+def _ytdlp_not_installed() -> None:
+    """Report a missing yt-dlp executable and exit."""
+    print("yt-dlp is not installed. Install it with: pip install yt-dlp")
+    sys.exit(1)
+
+
+# All yt-dlp spawns keep the default process options: adding preexec_fn,
+# cwd, start_new_session, user/group or umask would force CPython off its
+# vfork fast path (3.10+ on Linux) back to a full fork of this process.
+def run_ytdlp(args: Sequence[str]) -> str:
     """Execute yt-dlp with the given arguments."""
-    cmd = ["yt-dlp"] + args
+    cmd = ["yt-dlp", *YTDLP_COMMON_ARGS, *args]
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
         return result.stdout
@@ -23,8 +87,56 @@ def run_ytdlp(args: List[str]) -> str:
         print("Timeout - command took too long")
         return ""
     except FileNotFoundError:
-        print("yt-dlp is not installed. Install it with: pip install yt-dlp")
-        sys.exit(1)
+        _ytdlp_not_installed()
+        return ""
+
+
+def run_ytdlp_stream(args: Sequence[str]) -> Iterator[str]:
+    """Execute yt-dlp and yield its output lines as they are produced."""
+    try:
+        proc = subprocess.Popen(["yt-dlp", *YTDLP_COMMON_ARGS, *args], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, bufsize=1)
+    except FileNotFoundError:
+        _ytdlp_not_installed()
+        return
+    stdout = proc.stdout
+    assert stdout is not None  # stdout=PIPE always creates it
+
+    # Same 5-minute limit as run_ytdlp: killing yt-dlp ends the stream
+    timer = threading.Timer(300, proc.kill)
+    timer.start()
+    try:
+        for line in stdout:
+            yield line.rstrip('\n')
+        if timer.finished.is_set():
+            print("Timeout - command took too long")
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        stdout.close()
+
+
+def run_ytdlp_batch(args: List[str], urls: List[str]) -> str:
+    """Execute yt-dlp once for several URLs, fed on stdin as a batch file."""
+    # yt-dlp reads the whole batch before extracting, so one process per
+    # batch is the most that can be shared; stdin also avoids argv limits.
+    cmd = ["yt-dlp", *YTDLP_COMMON_ARGS, *args, "--batch-file", "-"]
+    try:
+        result = subprocess.run(cmd, input="\n".join(urls) + "\n",
+                                capture_output=True, text=True, timeout=300)
+        return result.stdout
+    except subprocess.TimeoutExpired as exc:
+        print("Timeout - command took too long")
+        # Keep the videos printed before the timeout, minus any cut-off last line
+        output = exc.stdout or ""
+        if isinstance(output, bytes):
+            output = output.decode('utf-8', 'replace')
+        return output[:output.rfind('\n') + 1]
+    except FileNotFoundError:
+        _ytdlp_not_installed()
+        return ""
 
 
 def get_channel_playlists(channel_url: str) -> List[Dict[str, Any]]:
@@ -32,17 +144,17 @@ def get_channel_playlists(channel_url: str) -> List[Dict[str, Any]]:
     print("Searching for channel playlists...")
 
     # Get playlists (flat-playlist is OK here, we only need playlist metadata)
-    playlists_url = channel_url.rstrip('/') + "/playlists"
+    playlists_url = channel_subpath(channel_url, "playlists")
     output = run_ytdlp([
         "--flat-playlist",
-        "--print", "%(id)s|||%(title)s",
+        "--print", "%(id)s\t%(title)s",
         playlists_url
     ])
 
     playlists = []
     for line in output.strip().split('\n'):
-        if '|||' in line:
-            pl_id, title = line.split('|||', 1)
+        if '\t' in line:
+            pl_id, title = line.split('\t', 1)
             playlists.append({
                 'id': pl_id,
                 'title': title,
@@ -52,8 +164,16 @@ def get_channel_playlists(channel_url: str) -> List[Dict[str, Any]]:
     return playlists
 
 
+@functools.lru_cache(maxsize=8192)
 def format_date(date_raw: Union[str, int, None] = "NA", timestamp: Union[str, int, None] = "NA") -> str:
     """Format date from YYYYMMDD to YYYY-MM-DD or convert timestamp."""
+    # Fast path for the common YYYYMMDD string
+    if isinstance(date_raw, str) and len(date_raw) == 8 and date_raw.isdigit():
+        return f"{date_raw[0:4]}-{date_raw[4:6]}-{date_raw[6:8]}"
+    # Already formatted as YYYY-MM-DD
+    if isinstance(date_raw, str) and len(date_raw) == 10 and date_raw[4] == '-' and date_raw[7] == '-':
+        return date_raw
+
     # Ensure we have strings
     date_str = str(date_raw) if date_raw is not None else "NA"
     ts_str = str(timestamp) if timestamp is not None else "NA"
@@ -77,12 +197,33 @@ def format_date(date_raw: Union[str, int, None] = "NA", timestamp: Union[str, in
     return "NA"
 
 
-def format_video_line(video: Dict[str, Any]) -> str:
+def video_url(video_id: str) -> str:
+    """Build the watch URL for a video ID."""
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def channel_subpath(channel_url: str, tab: str) -> str:
+    """Build the URL of a channel tab, keeping any query string intact."""
+    parts = urlsplit(channel_url)
+    return urlunsplit(parts._replace(path=parts.path.rstrip('/') + '/' + tab))
+
+
+def _video_with_url(video: Any) -> Dict[str, Any]:
+    """Return a video record as a plain dict with its watch URL filled in."""
+    if isinstance(video, Video):
+        return video.to_dict()
+    if 'url' in video or 'id' not in video:
+        return video
+    return dict(video, url=video_url(video['id']))
+
+
+def format_video_line(video: Mapping[str, Any]) -> str:
     """Format a video entry as a text line."""
-    date = str(video.get('upload_date', 'N/A'))
-    url = str(video.get('url', ''))
-    title = str(video.get('title', ''))
-    return f"[{date}] {url} - {title}\n"
+    # Records carry only the ID; the URL is built when a line is written
+    url = video.get('url')
+    if url is None:
+        url = video_url(video['id']) if 'id' in video else ''
+    return f"[{video.get('upload_date', 'N/A')}] {url} - {video.get('title', '')}\n"
 
 
 def _get_field(parts: List[str], index: int, default: str = "NA") -> str:
@@ -102,7 +243,12 @@ def _extract_date_fields(parts: List[str], include_availability: bool) -> tuple:
     return upload_date_raw, timestamp, release_date, release_timestamp
 
 
-def _get_best_date(upload_date_raw: str, timestamp: str, release_date: str, release_timestamp: str) -> str:
+def _get_best_date(
+    upload_date_raw: Union[str, int, None],
+    timestamp: Union[str, int, None],
+    release_date: Union[str, int, None],
+    release_timestamp: Union[str, int, None]
+) -> str:
     """Get the best available date from upload_date or release_date."""
     # Ensure all inputs are strings
     upload_date = format_date(str(upload_date_raw), str(timestamp))
@@ -111,7 +257,90 @@ def _get_best_date(upload_date_raw: str, timestamp: str, release_date: str, rele
     return upload_date
 
 
-def parse_video_entry(parts: List[str], include_availability: bool = True) -> Dict[str, Any]:
+_UNSET = object()
+
+
+class Video(MutableMapping[str, Any]):
+    """Compact video record that behaves as a mapping of its set fields plus its URL."""
+
+    __slots__ = ('id', 'title', 'availability', 'upload_date', 'found_in_playlist', 'reason')
+    _FIELDS = frozenset(__slots__)
+    _OPTIONAL_FIELDS = ('found_in_playlist', 'reason')
+
+    def __init__(self, id: str, title: str, availability: str, upload_date: str) -> None:
+        self.id = id
+        self.title = title
+        self.availability = availability
+        self.upload_date = upload_date
+
+    def __getitem__(self, key: str) -> Any:
+        # The URL is derived from the ID rather than stored with every record
+        if key == 'url' and hasattr(self, 'id'):
+            return video_url(self.id)
+        if key in self._FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._FIELDS or not hasattr(self, key):
+            raise KeyError(key)
+        delattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.__slots__:
+            if hasattr(self, key):
+                yield key
+            if key == 'title' and hasattr(self, 'id'):
+                yield 'url'
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if key == 'url':
+            key = 'id'
+        return key in self._FIELDS and hasattr(self, str(key))
+
+    def __repr__(self) -> str:
+        return f"Video({self.to_dict()!r})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._FIELDS:
+            return getattr(self, key, default)
+        if key == 'url':
+            return video_url(self.id) if hasattr(self, 'id') else default
+        return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dict, for serialization."""
+        # Read the slots directly: going through the mapping protocol costs a
+        # Python-level call per key, and this runs once per video when saving
+        try:
+            record: Dict[str, Any] = {
+                'id': self.id,
+                'title': self.title,
+                'url': video_url(self.id),
+                'availability': self.availability,
+                'upload_date': self.upload_date,
+            }
+        except AttributeError:  # a base field was deleted
+            return dict(self)
+        for key in self._OPTIONAL_FIELDS:
+            value = getattr(self, key, _UNSET)
+            if value is not _UNSET:
+                record[key] = value
+        return record
+
+
+def parse_video_entry(parts: List[str], include_availability: bool = True) -> Video:
     """Parse video data from yt-dlp output parts."""
     video_id = parts[0] if len(parts) > 0 else ""
     title = parts[1] if len(parts) > 1 else ""
@@ -124,154 +353,300 @@ def parse_video_entry(parts: List[str], include_availability: bool = True) -> Di
     upload_date_raw, timestamp, release_date, release_timestamp = _extract_date_fields(parts, include_availability)
     upload_date = _get_best_date(upload_date_raw, timestamp, release_date, release_timestamp)
 
-    return {
-        'id': video_id,
-        'title': title,
-        'url': f"https://www.youtube.com/watch?v={video_id}",
-        'availability': availability,
-        'upload_date': upload_date
-    }
+    return _video_record(video_id, title, availability, upload_date)
+
 
+def parse_video_entry_json(entry: Dict[str, Any], include_availability: bool = True) -> Video:
+    """Parse video data from a yt-dlp JSON record."""
+    video_id = str(entry.get('id') or "")
+    title = str(entry.get('title') or "")
 
-def get_playlist_videos(playlist_url: str) -> List[Dict[str, Any]]:
+    if include_availability:
+        availability = str(entry.get('availability') or "unknown")
+    else:
+        availability = "public"
+
+    upload_date = _get_best_date(
+        entry.get('upload_date'), entry.get('timestamp'),
+        entry.get('release_date'), entry.get('release_timestamp')
+    )
+
+    return _video_record(video_id, title, availability, upload_date)
+
+
+def _video_record(video_id: str, title: str, availability: str, upload_date: str) -> Video:
+    """Build the video record shared by all parsers."""
+    # Availability and dates take few distinct values: share one string each
+    return Video(video_id, title, sys.intern(availability), sys.intern(upload_date))
+
+
+def _iter_json_lines(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Decode one JSON object per line, skipping anything else yt-dlp prints."""
+    for line in lines:
+        if line.startswith('{'):
+            try:
+                yield _json_loads(line)
+            except ValueError:
+                continue
+
+
+def get_playlist_videos(playlist_url: str) -> List[Video]:
     """Retrieve all videos from a playlist."""
-    output = run_ytdlp([
+    args = FLAT_LISTING_ARGS + [
         "--skip-download",
         "--ignore-errors",
-        "--print", "%(id)s|||%(title)s|||%(availability)s|||%(upload_date)s|||%(timestamp)s|||%(release_date)s|||%(release_timestamp)s",
+        "--print", "%(.{id,title,availability,upload_date,timestamp,release_date,release_timestamp})j",
         playlist_url
-    ])
+    ]
 
-    videos: List[Dict[str, Any]] = []
-    for line in output.strip().split('\n'):
-        if '|||' in line:
-            parts = line.split('|||')
-            if len(parts) >= 2:
-                videos.append(parse_video_entry(parts, include_availability=True))
+    videos: List[Video] = [
+        parse_video_entry_json(entry, include_availability=True)
+        for entry in _iter_json_lines(run_ytdlp_stream(args))
+    ]
 
     return videos
 
 
-def get_channel_videos(channel_url: str) -> List[Dict[str, Any]]:
+def get_channel_videos(channel_url: str) -> List[Video]:
     """Retrieve public videos from the channel (Videos tab)."""
     print("🔍 Retrieving public videos from channel...")
 
-    videos_url = channel_url.rstrip('/') + "/videos"
-    output = run_ytdlp([
+    videos_url = channel_subpath(channel_url, "videos")
+    args = FLAT_LISTING_ARGS + [
         "--skip-download",
         "--ignore-errors",
-        "--print", "%(id)s|||%(title)s|||%(upload_date)s|||%(timestamp)s|||%(release_date)s|||%(release_timestamp)s",
+        "--print", "%(.{id,title,upload_date,timestamp,release_date,release_timestamp})j",
         videos_url
-    ])
+    ]
 
-    videos: List[Dict[str, Any]] = []
-    for line in output.strip().split('\n'):
-        if '|||' in line:
-            parts = line.split('|||')
-            if len(parts) >= 2:
-                videos.append(parse_video_entry(parts, include_availability=False))
+    videos: List[Video] = [
+        parse_video_entry_json(entry, include_availability=False)
+        for entry in _iter_json_lines(run_ytdlp_stream(args))
+    ]
 
     return videos
 
 
-def get_video_details(video_id: str) -> Dict[str, Any]:
-    """Fetch detailed metadata for a single video."""
-    output = run_ytdlp([
-        "--skip-download",
-        "--print", "%(id)s|||%(title)s|||%(availability)s|||%(upload_date)s",
-        f"https://www.youtube.com/watch?v={video_id}"
-    ])
-
-    if '|||' in output:
-        parts = output.strip().split('|||')
-        upload_date_raw = parts[3] if len(parts) > 3 else "NA"
-        upload_date = format_date(str(upload_date_raw))
-
-        return {
-            'availability': parts[2] if len(parts) > 2 else "unknown",
-            'upload_date': upload_date
-        }
-    return {}
-
-
-def _scan_all_playlists(playlists: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-    """Scan all playlists and collect unique videos."""
-    all_playlist_videos: Dict[str, Dict[str, Any]] = {}
+def _get_details_cache() -> Optional[sqlite3.Connection]:
+    """Open the on-disk details cache, or return None if it is unavailable."""
+    global _details_cache, _details_cache_failed
+    if _details_cache is None and not _details_cache_failed:
+        conn = None
+        try:
+            os.makedirs(os.path.dirname(DETAILS_CACHE_PATH), exist_ok=True)
+            conn = sqlite3.connect(DETAILS_CACHE_PATH, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS details "
+                "(id TEXT PRIMARY KEY, json TEXT, fetched_at INTEGER)"
+            )
+            _details_cache = conn
+        except (OSError, sqlite3.Error):
+            # Remember the failure rather than retrying for every video
+            _details_cache_failed = True
+            if conn is not None:
+                conn.close()
+    return _details_cache
+
+
+def _load_cached_details(video_id: str) -> Optional[Dict[str, Any]]:
+    """Return cached details for a video if present and not expired."""
+    cache = _get_details_cache()
+    if cache is None:
+        return None
+    try:
+        row = cache.execute(
+            "SELECT json FROM details WHERE id = ? AND fetched_at >= ?",
+            (video_id, int(time.time()) - DETAILS_CACHE_TTL)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    return json.loads(row[0]) if row else None
+
+
+def _store_cached_details(details_by_id: Dict[str, Dict[str, Any]]) -> None:
+    """Store fetched details in the on-disk cache in a single transaction."""
+    cache = _get_details_cache()
+    if cache is None:
+        return
+    # Unresolved fields may be a transient extraction failure: do not pin them for the TTL
+    now = int(time.time())
+    rows = [
+        (video_id, json.dumps(details), now)
+        for video_id, details in details_by_id.items()
+        if details.get('availability') not in UNRESOLVED_VALUES
+        and details.get('upload_date') not in UNRESOLVED_VALUES
+    ]
+    if not rows:
+        return
+    try:
+        with cache:
+            cache.executemany(
+                "INSERT OR REPLACE INTO details (id, json, fetched_at) VALUES (?, ?, ?)",
+                rows
+            )
+    except sqlite3.Error:
+        pass
+
+
+def _parse_video_details(parts: List[str]) -> Dict[str, Any]:
+    """Parse detailed metadata from yt-dlp output parts."""
+    upload_date_raw = parts[2] if len(parts) > 2 else "NA"
+    return {
+        'availability': parts[1] if len(parts) > 1 else "unknown",
+        'upload_date': format_date(str(upload_date_raw))
+    }
 
-    for i, playlist in enumerate(playlists, 1):
-        title = str(playlist.get('title', ''))[:50]
-        print(f"Scanning playlist {i}/{len(playlists)}: {title}...")
-        playlist_url = str(playlist.get('url', ''))
-        videos = get_playlist_videos(playlist_url)
 
-        for video in videos:
-            video['found_in_playlist'] = playlist.get('title', '')
-            video_id = str(video.get('id', ''))
-            if video_id and video_id not in all_playlist_videos:
-                all_playlist_videos[video_id] = video
+def get_video_details_batch(video_ids: List[str], workers: int = MAX_WORKERS) -> Dict[str, Dict[str, Any]]:
+    """Fetch detailed metadata for several videos, keyed by video ID."""
+    details_by_id: Dict[str, Dict[str, Any]] = {}
+    urls = []
+    for video_id in video_ids:
+        cached = _load_cached_details(video_id)
+        if cached is not None:
+            details_by_id[video_id] = cached
+        else:
+            urls.append(video_url(video_id))
+
+    if not urls:
+        return details_by_id
+
+    # Split cache misses into batches so their network waits overlap, without
+    # paying a yt-dlp startup for every single video; past MAX_BATCH_SIZE
+    # per batch, more batches are queued than there are workers
+    batch_count = max(1, min(workers, len(urls) // MIN_BATCH_SIZE),
+                      math.ceil(len(urls) / MAX_BATCH_SIZE))
+    batches = [urls[i::batch_count] for i in range(batch_count)]
+    args = [
+        "--skip-download",
+        "--ignore-errors",
+        # No title: a tab inside it would shift the columns that are read
+        "--print", "%(id)s\t%(availability)s\t%(upload_date)s"
+    ]
+    with ThreadPoolExecutor(max_workers=min(workers, batch_count)) as executor:
+        output = "\n".join(executor.map(lambda batch: run_ytdlp_batch(args, batch), batches))
 
-    return all_playlist_videos
+    fetched: Dict[str, Dict[str, Any]] = {}
+    for line in output.strip().split('\n'):
+        if '\t' in line:
+            parts = line.split('\t', 2)
+            fetched[parts[0]] = _parse_video_details(parts)
+    _store_cached_details(fetched)
+    details_by_id.update(fetched)
 
+    return details_by_id
 
-def _identify_unlisted_videos(
-    all_playlist_videos: Dict[str, Dict[str, Any]],
-    public_ids: set
-) -> List[Dict[str, Any]]:
-    """Identify videos that are in playlists but not in public videos."""
-    potentially_unlisted = []
 
+def get_video_details(video_id: str) -> Dict[str, Any]:
+    """Fetch detailed metadata for a single video."""
+    return get_video_details_batch([video_id]).get(video_id, {})
+
+
+def _scan_all_playlists(
+    playlists: List[Dict[str, Any]],
+    public_ids: Optional[set] = None,
+    workers: int = MAX_WORKERS
+) -> Tuple[Dict[str, Video], List[Video]]:
+    """Scan all playlists concurrently, collecting unique videos and those missing from public_ids."""
+    all_playlist_videos: Dict[str, Video] = {}
+    potentially_unlisted: List[Video] = []
+    if not playlists:
+        return all_playlist_videos, potentially_unlisted
+
+    pending: Dict[int, List[Video]] = {}
+    next_to_merge = 0
+    with ThreadPoolExecutor(max_workers=min(workers, len(playlists))) as executor:
+        futures = {
+            executor.submit(get_playlist_videos, str(playlist.get('url', ''))): i
+            for i, playlist in enumerate(playlists)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            pending[i] = future.result()
+            title = str(playlists[i].get('title', ''))[:50]
+            print(f"Scanned playlist {done}/{len(playlists)}: {title}...")
+
+            # Merge on the main thread, in playlist order so the first playlist
+            # wins, as soon as every earlier playlist is in. Merged lists are
+            # released right away. The dict is both the seen-set and the
+            # ordered record store; duplicates are dropped without being touched.
+            while next_to_merge in pending:
+                playlist_title = playlists[next_to_merge].get('title', '')
+                for video in pending.pop(next_to_merge):
+                    video_id = video.get('id')
+                    # One hash lookup: setdefault returns this video only if it is new
+                    if video_id and all_playlist_videos.setdefault(video_id, video) is video:
+                        video['found_in_playlist'] = playlist_title
+                        if public_ids is not None and video_id not in public_ids:
+                            video['reason'] = "In playlist but not in public videos"
+                            potentially_unlisted.append(video)
+                next_to_merge += 1
+
+    return all_playlist_videos, potentially_unlisted
+
+
+def _report_unlisted_videos(
+    potentially_unlisted: List[Video],
+    playlist_video_count: int,
+    public_video_count: int
+) -> None:
+    """Print the videos found in playlists but not in public videos."""
     print("\nAnalyzing videos...")
-    print(f"   Total videos in playlists: {len(all_playlist_videos)}")
-    print(f"   Total public videos: {len(public_ids)}")
-
-    for video_id, video in all_playlist_videos.items():
-        if video_id not in public_ids:
-            video['reason'] = "In playlist but not in public videos"
-            potentially_unlisted.append(video)
-            # Show availability if present
-            availability = video.get('availability', 'unknown')
-            title = str(video.get('title', ''))[:50]
-            print(f"   ✓ Found: {title} (availability: {availability})")
-
-    return potentially_unlisted
+    print(f"   Total videos in playlists: {playlist_video_count}")
+    print(f"   Total public videos: {public_video_count}")
+    # Individual videos are listed by print_results; one line keeps this step quiet
+    print(f"   ✓ Found {len(potentially_unlisted)} video(s) not in public videos")
 
 
 def _identify_unlisted_by_availability(
-    all_playlist_videos: Dict[str, Dict[str, Any]]
-) -> List[Dict[str, Any]]:
+    all_playlist_videos: Dict[str, Video]
+) -> List[Video]:
     """Identify videos by their availability status (for playlists-only mode)."""
     potentially_unlisted = []
 
     print("\n🔍 Analyzing videos by availability status...")
     print(f"   Total videos in playlists: {len(all_playlist_videos)}")
 
-    for video_id, video in all_playlist_videos.items():
+    for video in all_playlist_videos.values():
         availability = video.get('availability', 'unknown')
         if availability in ('unlisted', 'private'):
             video['reason'] = f"Availability status: {availability}"
             potentially_unlisted.append(video)
-            title = str(video.get('title', ''))[:50]
-            print(f"   ✓ Found: {title} (availability: {availability})")
 
+    # Individual videos are listed by print_results; one line keeps this step quiet
+    print(f"   ✓ Found {len(potentially_unlisted)} unlisted or private video(s)")
     return potentially_unlisted
 
 
-def _fetch_detailed_metadata(videos: List[Dict[str, Any]]) -> None:
+def _resolve_unknown_availability(videos: Iterable[Video], workers: int = MAX_WORKERS) -> None:
+    """Fetch availability for playlist videos whose flat listing did not report it."""
+    # Flat listings only know availability from badges, so most entries are unknown
+    unknown = [video for video in videos if video.get('availability') in UNRESOLVED_VALUES]
+    if unknown:
+        _fetch_detailed_metadata(unknown, workers)
+
+
+def _fetch_detailed_metadata(videos: List[Video], workers: int = MAX_WORKERS) -> None:
     """Fetch detailed metadata for a list of videos."""
+    # All videos go out in batches at once, so one line stands in for progress
     print(f"Fetching detailed metadata for {len(videos)} videos...")
 
-    for i, video in enumerate(videos, 1):
-        video_dict = dict(video) if isinstance(video, dict) else {}
-        title = str(video_dict.get('title', ''))[:40]
-        print(f"   [{i}/{len(videos)}] {title}...")
-        video_id = str(video_dict.get('id', ''))
-        if video_id:
-            details = get_video_details(video_id)
-            if details and isinstance(video, dict):
-                video.update(details)
+    video_ids = [str(video['id']) for video in videos if video.get('id')]
+
+    details_by_id = get_video_details_batch(video_ids, workers)
+
+    for video in videos:
+        details = details_by_id.get(str(video.get('id', '')))
+        if details:
+            video.update(details)
 
 
-def scan_channel(channel_url: str, include_public: bool = True, detailed: bool = False) -> Dict[str, Any]:
+def scan_channel(
+    channel_url: str,
+    include_public: bool = True,
+    detailed: bool = False,
+    workers: int = MAX_WORKERS
+) -> Dict[str, Any]:
     """Scan a complete YouTube channel."""
     results: Dict[str, Any] = {
         'channel_url': channel_url,
@@ -283,7 +658,7 @@ def scan_channel(channel_url: str, include_public: bool = True, detailed: bool =
     }
 
     # 1. Get public videos
-    public_ids: set = set()
+    public_ids: Optional[set] = None
     if include_public:
         public_videos = get_channel_videos(channel_url)
         results['public_videos'] = public_videos
@@ -299,26 +674,32 @@ def scan_channel(channel_url: str, include_public: bool = True, detailed: bool =
     for pl in playlists[:3]:  # Show first 3
         print(f"   - {pl.get('title', 'N/A')}")
 
-    # 3. Scan each playlist
+    # 3. Scan each playlist; in full scan mode this also compares playlist
+    # videos with public videos as they are merged
     print("")
-    all_playlist_videos = _scan_all_playlists(playlists)
+    all_playlist_videos, potentially_unlisted = _scan_all_playlists(playlists, public_ids, workers)
     results['playlist_videos'] = list(all_playlist_videos.values())
     print(f"\n✓ {len(all_playlist_videos)} unique videos found in playlists")
 
-    # 4. Identify potentially unlisted videos
-    if include_public:
-        # Full scan mode: compare playlist videos with public videos
-        potentially_unlisted = _identify_unlisted_videos(all_playlist_videos, public_ids)
+    # 4. Report potentially unlisted videos
+    if public_ids is not None:
+        _report_unlisted_videos(potentially_unlisted, len(all_playlist_videos), len(public_ids))
+        # Candidates are few: fill in the availability their listing left
+        # unknown, unless --detailed is about to re-fetch them all anyway
+        if not detailed:
+            _resolve_unknown_availability(potentially_unlisted, workers)
     else:
         # Playlists-only mode: identify by availability status
+        _resolve_unknown_availability(all_playlist_videos.values(), workers)
         potentially_unlisted = _identify_unlisted_by_availability(all_playlist_videos)
 
     results['potentially_unlisted'] = potentially_unlisted
     print(f"\n✓ {len(potentially_unlisted)} potentially unlisted videos found")
 
-    # Fetch detailed metadata if requested
+    # Fetch detailed metadata if requested: listing dates are only approximate,
+    # so every potentially unlisted video is re-fetched (the disk cache still applies)
     if detailed and potentially_unlisted:
-        _fetch_detailed_metadata(potentially_unlisted)
+        _fetch_detailed_metadata(potentially_unlisted, workers)
 
     return results
 
@@ -344,21 +725,53 @@ def print_results(results: Dict[str, Any]) -> None:
         print("POTENTIALLY UNLISTED VIDEOS:")
         print("-" * 60)
         for video in potentially_unlisted:
-            if isinstance(video, dict):
-                title = str(video.get('title', 'Unknown'))[:60]
-                url = str(video.get('url', 'N/A'))
-                upload_date = str(video.get('upload_date', 'N/A'))
-                found_in = str(video.get('found_in_playlist', 'N/A'))
-                print(f"\n  {title}")
-                print(f"     URL: {url}")
-                print(f"     Date: {upload_date}")
-                print(f"     Found in: {found_in}")
+            title = str(video.get('title', 'Unknown'))[:60]
+            url = video_url(video['id']) if 'id' in video else 'N/A'
+            upload_date = str(video.get('upload_date', 'N/A'))
+            found_in = str(video.get('found_in_playlist', 'N/A'))
+            print(f"\n  {title}")
+            print(f"     URL: {url}")
+            print(f"     Date: {upload_date}")
+            print(f"     Found in: {found_in}")
+
+
+RESULT_SECTIONS = ('public_videos', 'playlists', 'playlist_videos', 'potentially_unlisted')
+VIDEO_SECTIONS = ('public_videos', 'playlist_videos', 'potentially_unlisted')
 
 
 def save_results(results: Dict[str, Any], filename: str) -> None:
     """Save results to JSON file."""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    # Video records are converted one at a time by the encoder's default
+    # hook, so the results are never copied as a whole before dumping
+    if orjson is not None:
+        # orjson writes UTF-8 bytes directly, like ensure_ascii=False
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(results, default=_video_with_url, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(results, f, default=_video_with_url, ensure_ascii=False, indent=2)
+    print(f"\nResults saved to: {filename}")
+
+
+def _iter_ndjson_records(results: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield a header record, then one record per list entry tagged with its section."""
+    yield {key: value for key, value in results.items() if key not in RESULT_SECTIONS}
+    for section in RESULT_SECTIONS:
+        for record in results.get(section, []):
+            if section in VIDEO_SECTIONS:
+                record = _video_with_url(record)
+            yield {'section': section, **record}
+
+
+def save_results_ndjson(results: Dict[str, Any], filename: str) -> None:
+    """Save results to a newline-delimited JSON file, one record per line."""
+    records = _iter_ndjson_records(results)
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.writelines(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in records)
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
     print(f"\nResults saved to: {filename}")
 
 
@@ -368,6 +781,14 @@ def get_default_filename():
     return f"youtube_scan_{date_str}.json"
 
 
+def _positive_int(value: str) -> int:
+    """Argparse type for strictly positive integers."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Scan a YouTube channel to find unlisted videos"
@@ -379,7 +800,8 @@ def main():
     parser.add_argument(
         "-o", "--output",
         default=None,
-        help="Output JSON file (default: youtube_scan_YYYY-MM-DD_HHMMSS.json)"
+        help="Output JSON file, or NDJSON if it ends in .ndjson "
+             "(default: youtube_scan_YYYY-MM-DD_HHMMSS.json)"
     )
     parser.add_argument(
         "--playlists-only",
@@ -389,7 +811,13 @@ def main():
     parser.add_argument(
         "--detailed",
         action="store_true",
-        help="Fetch detailed metadata for each video (slower but more accurate dates)"
+        help="Fetch exact dates and availability for potentially unlisted videos (slower)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=MAX_WORKERS,
+        help=f"Number of yt-dlp processes to run in parallel (default: {MAX_WORKERS})"
     )
 
     args = parser.parse_args()
@@ -405,29 +833,32 @@ def main():
         f"Mode: {'Detailed' if args.detailed else 'Fast'} | {'Playlists only' if args.playlists_only else 'Full scan'}")
     print("=" * 60 + "\n")
 
-    # Scan the channel
     results = scan_channel(
         args.channel_url,
         include_public=not args.playlists_only,
-        detailed=args.detailed
+        detailed=args.detailed,
+        workers=args.workers
     )
 
     # Display and save
     print_results(results)
-    save_results(results, output_file)
+    if output_file.endswith('.ndjson'):
+        save_results_ndjson(results, output_file)
+    else:
+        save_results(results, output_file)
 
     # Also create a simple text file with links
-    links_file = output_file.replace('.json', '_links.txt')
-    with open(links_file, 'w', encoding='utf-8') as f:
+    links_file = os.path.splitext(output_file)[0] + '_links.txt'
+    with open(links_file, 'w', encoding='utf-8', buffering=LINKS_BUFFER_SIZE) as f:
+        # Unlisted videos are the same records as in playlist_videos: format them once
+        unlisted_lines = {id(video): format_video_line(video)
+                          for video in results.get('potentially_unlisted', [])}
         f.write("# Potentially unlisted videos\n\n")
-        for video in results.get('potentially_unlisted', []):
-            if isinstance(video, dict):
-                f.write(format_video_line(video))
+        f.writelines(unlisted_lines.values())
 
         f.write("\n\n# All playlist videos\n\n")
-        for video in results.get('playlist_videos', []):
-            if isinstance(video, dict):
-                f.write(format_video_line(video))
+        f.writelines(unlisted_lines.get(id(video)) or format_video_line(video)
+                     for video in results.get('playlist_videos', []))
 
     print(f"Links saved to: {links_file}")
 